@@ -18,11 +18,12 @@
 
 
 import os
-import re
+import io
 import argparse
 import sys
 import glob
-from collections import defaultdict
+import concurrent.futures
+from collections import Counter
 from FSCtypes import *
 from InfoBlocks import IB
 
@@ -65,197 +66,249 @@ def check_filename_compatibility(filename):
     Checks if a filename can be safely encoded to the legacy system's encoding.
     Returns True if compatible, False otherwise.
     """
-    try:
-        # Attempt to encode the filename using the legacy encoding strictly
-        filename.encode(LEGACY_ENCODING, errors='strict')
-        return True
-    except UnicodeEncodeError:
-        # If an error occurs, it means a character is incompatible
-        return False
-
-def process_symbol_images(directory_path):
-
-    all_symbols = []
-
-    # This regex captures: 
-    # (.*?) -> The symbol name (non-greedy match for anything)
-    # \s+vari_0[1-2]{1}\.png$ -> Matches the ' vari_XX.png' suffix
-    varicolor_pattern = re.compile(r"(.*?)\s+vari_0[1-2]{1}\.png$", re.IGNORECASE)
-    subgroup_pattern = re.compile(r"^(.*?)(\d+)$", re.IGNORECASE)
-
-    # Dictionary to hold lists of files, grouped by their base name
-    groups = defaultdict(list)
-    subgroup_varicolor = defaultdict(list)  # Hold names without any number extension
-    subgroup_normal = defaultdict(list)  # Hold names without any number extension
+    # The legacy encoding is plain ASCII, so str.isascii() answers this directly
+    # without encoding the name or raising and catching UnicodeEncodeError.
+    return filename.isascii()
+
+# Characters that make a source directory argument a glob pattern
+GLOB_WILDCARDS = '*?['
+
+# Varicolor pairs are named '<symbol name> vari_01.png' and '<symbol name> vari_02.png'.
+VARICOLOR_SUFFIXES = ('vari_01.png', 'vari_02.png')
+VARICOLOR_SUFFIX_LEN = len(VARICOLOR_SUFFIXES[0])
+
+def varicolor_base_name(filename, name_lower):
+    """
+    Returns the symbol name of a varicolor PNG (the part before the whitespace
+    and ' vari_0X.png' suffix), or None if the filename is not a varicolor PNG.
+    name_lower is filename.lower(), which the caller has already computed for its
+    own '.png' check. Plain string checks are used here as this runs once for
+    every file scanned.
+    """
+    if not name_lower.endswith(VARICOLOR_SUFFIXES):
+        return None
+    name = filename[:-VARICOLOR_SUFFIX_LEN]
+    # The suffix must be separated from the symbol name by whitespace
+    if not name[-1:].isspace():
+        return None
+    return name.rstrip()
+
+def name_without_trailing_number(symbol_name):
+    """
+    Returns the symbol name with any trailing digits removed (e.g. "Tree 01" -> "Tree "),
+    or None if the name does not end with a number.
+    """
+    stripped = symbol_name.rstrip('0123456789')
+    if len(stripped) == len(symbol_name):
+        return None
+    return stripped
+
+def process_symbol_images(directory_path, out_fp, log=print):
+    """
+    Creates symbols for the PNG files in directory_path and writes them straight to
+    the open (binary) output file out_fp. Returns the number of symbols written.
+    The ctypes symbol structures support the buffer protocol, so they are written
+    without first being copied into a bytes object.
+    Progress and warning messages are passed to log (print by default).
+    """
+
+    # Normalize the directory once; the DirEntry paths built from it are then
+    # already in clean OS style, so the individual file paths need no normpath.
+    # The one exception is the current directory: normpath leaves it as ".", and
+    # DirEntry.path would give "./name", where normpath gave just the file name.
+    directory_path = os.path.normpath(directory_path)
+    in_current_dir = directory_path == os.curdir
+
+    symbol_count = 0
+
+    # Dictionary of base name -> (varicolor files, normal files). Each file is classified
+    # as it is found, so the second pass doesn't need to inspect the paths again.
+    groups = {}
+    subgroup_varicolor = Counter()  # Count of files per name without any number extension
+    subgroup_normal = Counter()  # Count of files per name without any number extension
+    subgroup_names = {}  # Symbol name -> name without number extension (or None), computed once per name
     skip_count = 0
 
     # 1. First pass: Identify base names and group files
-    for filename in os.listdir(directory_path):
-        if not filename.lower().endswith('.png'):
-            continue
-        if filename.lower().startswith('.'):
-            continue
-
-        # --- FILENAME COMPATIBILITY CHECK ---
-        if not check_filename_compatibility(filename):
-            print(f"\n[ERROR] Incompatible filename found: '{filename}'")
-            print(f"This file contains characters not supported by the '{LEGACY_ENCODING}' standard.")
-            print("Please rename the file to use only standard ASCII characters and try again.")
-            print("Skipping this file.\n")
-            skip_count += 1
-            continue # Skip this file and move to the next one
-        # ------------------------------------
+    # os.scandir() yields DirEntry objects that already carry the full path and
+    # cached file type, which avoids a separate stat() call for every file.
+    with os.scandir(directory_path) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            filename = entry.name
+            # Check just the extension first so other files are dropped
+            # without lower-casing their whole name
+            if filename[-4:].lower() != '.png':
+                continue
+            if filename.startswith('.'):
+                continue
+            name_lower = filename.lower()
+
+            # --- FILENAME COMPATIBILITY CHECK ---
+            if not check_filename_compatibility(filename):
+                log(f"\n[ERROR] Incompatible filename found: '{filename}'")
+                log(f"This file contains characters not supported by the '{LEGACY_ENCODING}' standard.")
+                log("Please rename the file to use only standard ASCII characters and try again.")
+                log("Skipping this file.\n")
+                skip_count += 1
+                continue # Skip this file and move to the next one
+            # ------------------------------------
             
-        full_path = os.path.join(directory_path, filename)
+            full_path = filename if in_current_dir else entry.path
         
-        # Check if the file matches the varicolor pattern
-        match = varicolor_pattern.match(filename)
+            # Check if the file follows the varicolor naming convention
+            varicolor_name = varicolor_base_name(filename, name_lower)
         
-        if match:
-            # If it's a varicolor, the base name is the captured group (symbol name)
-            base_symbol_name = match.group(1)
-        else:
-            # If it's a single file (e.g., "Walled Garden 001.png"), 
-            # its base name is its filename without the .png extension
-            base_symbol_name = os.path.splitext(filename)[0]
-
-        # If symbol name exceeds 32 characters, skip it with a warning
-        if len(base_symbol_name) > 32:
-            print(f"--- Warning: Symbol name '{base_symbol_name}' exceeds 32 characters. Skipping file '{filename}'. ---")
-            skip_count += 1
-            continue
-
-        groups[base_symbol_name].append(full_path)
-
-        # Further process to identify subgroups without number extensions
-        subgroup_match = subgroup_pattern.match(base_symbol_name)
-        if subgroup_match:
-            name_without_number = subgroup_match.group(1)
-            if (match):
-                subgroup_varicolor[name_without_number].append(full_path)
+            if varicolor_name is not None:
+                # If it's a varicolor, the base name is the symbol name before the suffix
+                base_symbol_name = varicolor_name
             else:
-                subgroup_normal[name_without_number].append(full_path)
-
-    # 2. Second pass: Process the groups based on group size
-    for symbol_name, files in groups.items():
-        # If the len(files) is 3, and 2 are "vari" then there are two varicolor PNGs and one normal
-        if len(files) == 3 and sum(1 for f in files if "vari_" in f) == 2:
-            # Sort files by name to ensure consistent handling of _01 and _02
-            files.sort()
-            # Identify the normal file
-            normal_file = next(f for f in files if "vari_" not in f)
-            varicolor_files = [f for f in files if "vari_" in f]
-
-            # Check if the varicolor symbol name is part of the subgroup_varicolor.
-            # If so, and if there are more than 2 files in that subgroup, set group to True
-            # We need more than 2 because the current two are just a single pair of variants.
-            group = False
-            subname_match = subgroup_pattern.match(symbol_name)
-            if subname_match:
-                if subname_match.group(1) in subgroup_varicolor:
-                    if len(subgroup_varicolor[subname_match.group(1)]) > 2:
-                        group = True
-            all_symbols.append(bytes(handle_varicolor_pair(symbol_name, varicolor_files[0], varicolor_files[1], group)))
+                # If it's a single file (e.g., "Walled Garden 001.png"), 
+                # its base name is its filename without the .png extension
+                base_symbol_name = os.path.splitext(filename)[0]
+
+            # If symbol name exceeds 32 characters, skip it with a warning
+            if len(base_symbol_name) > 32:
+                log(f"--- Warning: Symbol name '{base_symbol_name}' exceeds 32 characters. Skipping file '{filename}'. ---")
+                skip_count += 1
+                continue
+
+            varicolor_files, normal_files = groups.setdefault(base_symbol_name, ([], []))
+            # A name that contains "vari_" without the proper suffix (e.g. "Tree vari_03.png"
+            # or "Novari_01.png") is filed with the varicolor files too. It can't make a pair,
+            # so it is reported as an unhandled group below instead of silently becoming a
+            # normal symbol.
+            if varicolor_name is not None or 'vari_' in filename:
+                varicolor_files.append(full_path)
+            else:
+                normal_files.append(full_path)
+
+            # Further process to identify subgroups without number extensions
+            name_without_number = name_without_trailing_number(base_symbol_name)
+            subgroup_names[base_symbol_name] = name_without_number
+            if name_without_number is not None:
+                if varicolor_name is not None:
+                    subgroup_varicolor[name_without_number] += 1
+                else:
+                    subgroup_normal[name_without_number] += 1
 
-            # Check if the normal symbol file is part of the subgroup_normal.
-            group = False
-            subname_match = subgroup_pattern.match(symbol_name)
-            if subname_match:
-                if subname_match.group(1) in subgroup_normal:
-                    if len(subgroup_normal[subname_match.group(1)]) > 1:
-                        group = True
-            all_symbols.append(bytes(handle_single_symbol(symbol_name, normal_file, group)))
+    # 2. Second pass: Process the groups based on how many of each kind of file they hold
+    for symbol_name, (varicolor_files, normal_files) in groups.items():
+        # Reuse the subgroup name found in the first pass
+        subname = subgroup_names[symbol_name]
 
-        # Handle just 2 varicolor PNG files
-        elif len(files) == 2 and all("vari_" in f for f in files):
+        # Handle 2 varicolor PNG files, optionally accompanied by one normal PNG
+        if len(varicolor_files) == 2 and len(normal_files) <= 1:
             # Sort files by name to ensure consistent handling of _01 and _02
-            files.sort()
+            varicolor_files.sort()
 
-            # Check if the file is part of the subgroup_varicolor.
+            # Check if the varicolor symbol name is part of the subgroup_varicolor.
             # If so, and if there are more than 2 files in that subgroup, set group to True
             # We need more than 2 because the current two are just a single pair of variants.
             group = False
-            subname_match = subgroup_pattern.match(symbol_name)
-            if subname_match:
-                if subname_match.group(1) in subgroup_varicolor:
-                    if len(subgroup_varicolor[subname_match.group(1)]) > 2:
+            if subname is not None:
+                if subname in subgroup_varicolor:
+                    if subgroup_varicolor[subname] > 2:
                         group = True
+            out_fp.write(handle_varicolor_pair(symbol_name, varicolor_files[0], varicolor_files[1], group))
+            symbol_count += 1
+
+            if normal_files:
+                # Check if the normal symbol file is part of the subgroup_normal.
+                group = False
+                if subname is not None:
+                    if subname in subgroup_normal:
+                        if subgroup_normal[subname] > 1:
+                            group = True
+                out_fp.write(handle_single_symbol(symbol_name, normal_files[0], group))
+                symbol_count += 1
 
-            all_symbols.append(bytes(handle_varicolor_pair(symbol_name, files[0], files[1], group)))
-        
         # Handle just normal PNG file
-        elif len(files) == 1 and "vari_" not in files[0]:
+        elif not varicolor_files and len(normal_files) == 1:
             # Check if the file is part of the subgroup_normal.
             group = False
-            subname_match = subgroup_pattern.match(symbol_name)
-            if subname_match:
-                if subname_match.group(1) in subgroup_normal:
-                    if len(subgroup_normal[subname_match.group(1)]) > 1:
+            if subname is not None:
+                if subname in subgroup_normal:
+                    if subgroup_normal[subname] > 1:
                         group = True
-            all_symbols.append(bytes(handle_single_symbol(symbol_name, files[0], group)))
+            out_fp.write(handle_single_symbol(symbol_name, normal_files[0], group))
+            symbol_count += 1
             
         else:
-            print(f"--- Warning: Unhandled group for '{symbol_name}': {files} ---")
+            log(f"--- Warning: Unhandled group for '{symbol_name}': {varicolor_files + normal_files} ---")
 
-    print(f"\tSymbols created: {len(all_symbols)}")
+    log(f"\tSymbols created: {symbol_count}")
     if skip_count > 0:
-        print(f"\tFiles skipped due to incompatible filenames: {skip_count}")
+        log(f"\tFiles skipped due to incompatible filenames: {skip_count}")
+
+    return symbol_count
 
-    return b"".join(all_symbols)
+def process_symbol_directory(directory_path):
+    """
+    Builds the symbols for one directory into an in-memory buffer and collects the
+    progress messages instead of printing them, so that several directories can be
+    processed on worker threads while the caller writes the results out in order.
+    Returns a tuple of (symbol bytes, list of messages).
+    """
+    # BytesIO grows its buffer geometrically, much like a bytearray, so symbols are
+    # appended without a separate allocation each and no final b"".join() is needed.
+    buffer = io.BytesIO()
+    messages = []
+    process_symbol_images(directory_path, buffer, log=messages.append)
+    return buffer.getvalue(), messages
 
 def handle_varicolor_pair(symbol_name, file_01_path, file_02_path, isGroup):
 #    print(f"  File 1: {os.path.basename(file_01_path)}")
 #    print(f"  File 2: {os.path.basename(file_02_path)}")
 #    print(f"  Is part of subgroup: {isGroup}")
 
-    vari_symbol = VaricolorSymbol(symbol_name, os.path.normpath(file_01_path), os.path.normpath(file_02_path), isGroup)
+    vari_symbol = VaricolorSymbol(symbol_name, file_01_path, file_02_path, isGroup)
     return vari_symbol
 
 def handle_single_symbol(symbol_name, file_path, isGroup):
 #    print(f"  File: {os.path.basename(file_path)}")
 #    print(f"  Is part of subgroup: {isGroup}")
 
-    single_symbol = SimpleSymbol(symbol_name, os.path.normpath(file_path), isGroup)
+    single_symbol = SimpleSymbol(symbol_name, file_path, isGroup)
     return single_symbol
 
 # ----------------------------
 
 
-# --- Main execution block ---
-if __name__ == "__main__":
-    # This is a work-in-progress script to process PNG symbol files into FSC symbol objects.
-    # Eventual goal is to combine my brush extraction program with this one to produce a workflow that:
-    #   1) extracts PNGs from an ABR file
-    #   2) processes those PNGs into SingleSymbol and VaricolorSymbol objects
-    #   3) combines those symbol objects with InfoBlocks to produce final FSC files for CC3+
-
-    # Parse command line arguments for source directories (one or more) and an output file name
-    # -s [<source_directory> <source_directory2> ...] -o <output_fsc_file>
-    args = parse_arguments()
-
+def build_catalog(source_dirs, output_file):
+    """
+    Creates an FSC symbol catalog named output_file from the PNG files in source_dirs.
+    Each entry in source_dirs may be a directory path or a wildcard pattern.
+    Exits with an error if none of them resolve to a directory.
+    """
     # List to store all final, expanded directory paths
     expanded_source_dirs = []
 
     print("--- Expanding Source Directory Wildcards ---")
 
-    for potential_pattern in args.source_dirs:
-        # Use glob.glob() to expand the wildcard into a list of matching paths
-        # glob() returns an empty list if no matches are found
-        matches = glob.glob(potential_pattern)
-        
-        if matches:
-            for match in matches:
+    for potential_pattern in source_dirs:
+        # Only hand the argument to glob when it actually contains wildcard characters.
+        # A plain path needs just one isdir() check, with no directory scan by glob.
+        found_match = False
+        if any(c in potential_pattern for c in GLOB_WILDCARDS):
+            # glob.iglob() yields the matching paths lazily instead of building a list
+            for match in glob.iglob(potential_pattern):
+                found_match = True
                 # Ensure we only add actual directories, not files that matched the pattern
                 if os.path.isdir(match):
                     expanded_source_dirs.append(os.path.normpath(match)) # Use normpath for clean OS style
                     print(f"  + Expanded: {match}")
                 else:
                     print(f"  - Skipped: {match} (is a file, not a directory)")
-        else:
-            # If glob found nothing, treat the input string as a literal path and check if it exists
+
+        if not found_match:
+            # No wildcards, or glob found nothing: treat the input string as a literal path
             if os.path.isdir(potential_pattern):
                  expanded_source_dirs.append(os.path.normpath(potential_pattern))
                  print(f"  + Added literal directory: {potential_pattern}")
+            elif os.path.exists(potential_pattern):
+                 print(f"  - Skipped: {potential_pattern} (is a file, not a directory)")
             else:
                  print(f"  - Warning: Source directory not found: {potential_pattern}")
 
@@ -265,38 +318,64 @@ if __name__ == "__main__":
         sys.exit(1)
 
     print(f"--- Script Configuration ---")
-    print(f"Output File: {os.path.abspath(args.output_file)}")
-    symbol_list = []
-    dir_count=1
-    for directory in expanded_source_dirs:
-        print(f"Source Directory {dir_count}:")
-        print(f"  - {os.path.abspath(directory)}")
-        symbols_from_dir = process_symbol_images(directory)
-        symbol_list.append(symbols_from_dir)
-        dir_count += 1
-    symbols = b"".join(symbol_list)
-
+    print(f"Output File: {os.path.abspath(output_file)}")
 
     # Build the canned info blocks
     infoblocks = IB.assemble_info_blocks()
 
-    # Create the symbol objects from the PNG files in the source directory
-    #symbol_list = process_symbol_images("C:/Users/nospa/Downloads/Here There Be Monsters PNG Pack 1.1/Vrients' Monsters (1583-1608)")
-    #symbol_list2 = process_symbol_images("C:/Users/nospa/Downloads/here-there-be-monsters-1.1/Here There Be Monsters 1.1/PNG")
-    
     # Create the FSC header
     fsc_header = FileID()
 
     # For now, create noncompressed FSC file
-    # Write out all the parts to a single file
-    output_fsc_path = os.path.join(".", args.output_file)
-    with open(output_fsc_path, "wb") as fsc_file:
-        fsc_file.write(bytes(fsc_header))
-        fsc_file.write(bytes(infoblocks))
-        fsc_file.write(symbols) 
-        print(f"\nFSC file written to: {output_fsc_path}")
-
-
+    # Write the header and info blocks, then the symbols from each directory.
+    # A single directory (the usual case) is streamed straight into the file.
+    # Several directories are independent, so they are scanned on a small thread pool
+    # (the file reads release the GIL) and written out in their original order.
+    # Note that PNG read errors are printed to stderr as they happen, so with several
+    # directories they may not appear under their directory's heading.
+    # The symbols are written as they are built, so the catalog goes to a temporary file
+    # next to output_file that only replaces it once complete. If anything fails part
+    # way through, the partial file is removed and any existing catalog is left intact.
+    output_fsc_path = output_file
+    temp_fsc_path = f"{output_fsc_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_fsc_path, "wb", buffering=1 << 20) as fsc_file:
+            # Both parts are fully built already, so hand them over in one call
+            fsc_file.writelines((bytes(fsc_header), infoblocks))
+            if len(expanded_source_dirs) == 1:
+                directory = expanded_source_dirs[0]
+                print(f"Source Directory 1:")
+                print(f"  - {os.path.abspath(directory)}")
+                process_symbol_images(directory, fsc_file)
+            else:
+                max_workers = min(8, len(expanded_source_dirs))
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    results = executor.map(process_symbol_directory, expanded_source_dirs)
+                    dir_count=1
+                    for directory, (symbol_data, messages) in zip(expanded_source_dirs, results):
+                        print(f"Source Directory {dir_count}:")
+                        print(f"  - {os.path.abspath(directory)}")
+                        for message in messages:
+                            print(message)
+                        fsc_file.write(symbol_data)
+                        dir_count += 1
+        os.replace(temp_fsc_path, output_fsc_path)
+    except BaseException:
+        if os.path.exists(temp_fsc_path):
+            os.remove(temp_fsc_path)
+        raise
+    print(f"\nFSC file written to: {output_fsc_path}")
 
 
+# --- Main execution block ---
+if __name__ == "__main__":
+    # This is a work-in-progress script to process PNG symbol files into FSC symbol objects.
+    # Eventual goal is to combine my brush extraction program with this one to produce a workflow that:
+    #   1) extracts PNGs from an ABR file
+    #   2) processes those PNGs into SingleSymbol and VaricolorSymbol objects
+    #   3) combines those symbol objects with InfoBlocks to produce final FSC files for CC3+
 
+    # Parse command line arguments for source directories (one or more) and an output file name
+    # -s [<source_directory> <source_directory2> ...] -o <output_fsc_file>
+    args = parse_arguments()
+    build_catalog(args.source_dirs, args.output_file)
@@ -2,6 +2,7 @@ import argparse
 import os
 import sys
 import subprocess
+from FSC_create_symbol_catalog import build_catalog
 
 def main():
     # 1. Initialize the parser and set the program description
@@ -47,38 +48,35 @@ def main():
     if args.png_create or args.varicolor:
         print("Processing initiated...")
 
-        # Save existing working directory to return later
-        original_dir = os.getcwd()
-
-        # Change working directory to output directory, create if it doesn't exist
-        if not os.path.exists(args.output_dir):
-            os.makedirs(args.output_dir)
-            output_dir = os.path.abspath(args.output_dir)
-        else:
-            output_dir = os.path.abspath(args.output_dir)
-        os.chdir(output_dir)
+        # Create the output directory if it doesn't exist
+        output_dir = os.path.abspath(args.output_dir)
+        os.makedirs(output_dir, exist_ok=True)
 
+        # abr2png writes its PNGs to its working directory, so run it in the output
+        # directory via cwd= rather than changing this process's working directory.
+        # The brush path is made absolute so it still resolves from there.
+        brush_file = os.path.abspath(args.brush_file)
+        commands = []
         if args.png_create:
             command = ["abr2png"]
-            command.extend(["-png", args.brush_file])
-            subprocess.run(command) 
+            command.extend(["-png", brush_file])
+            commands.append(command)
         if args.varicolor:
             command = ["abr2png"]
-            command.extend(["-cc3", args.brush_file])
-            subprocess.run(command)
+            command.extend(["-cc3", brush_file])
+            commands.append(command)
 
-        # Return to the original directory where we started
-        os.chdir(original_dir)
+        # The PNG and varicolor extractions are independent of each other, so when both
+        # are requested start them together and wait for both to finish.
+        processes = [subprocess.Popen(command, cwd=output_dir) for command in commands]
+        for process in processes:
+            process.wait()
 
-        # Run FSC_create_symbol_catalog.py to create the catalog
+        # Create the catalog in-process rather than launching FSC_create_symbol_catalog.py
+        # in a second Python interpreter.
         # Use the output directory name as the catalog name, appended with ".FSC" extension
         catalog_name = os.path.basename(output_dir) + ".FSC"
-        command = [
-            "python", "FSC_create_symbol_catalog.py",
-            "-s", output_dir,
-            "-o", catalog_name
-        ]
-        subprocess.run(command)
+        build_catalog([output_dir], catalog_name)
     else:
         print("No operation flags specified (-p or -v). Exiting.")
         sys.exit(1)
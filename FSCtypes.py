@@ -35,6 +35,9 @@
 #
 # These instances can then be converted to bytes and written to FSC files
 # assuming you create the appropriate file structure around them.
+# Use bytes(symbol) when a bytes copy is needed. Binary files accept the
+# structures directly through the buffer protocol, so fsc_file.write(symbol)
+# writes one without making that copy.
 # See the `FSC_create_Symbol_catalog.py` script for an example of how to use these classes
 # to create a complete FSC file.
 # ----------------------------------------------------------------------
@@ -44,8 +47,12 @@
 # License: MIT License
 # ----------------------------------------------------------------------
 
+from collections import namedtuple
+import concurrent.futures
 import ctypes
 from enum import IntEnum
+import functools
+import mmap
 import os
 import struct
 import sys
@@ -120,22 +127,58 @@ TF_MIRROR_Y          = 0x00000040  # randomly mirror in Y
 
 #--- Helpers ----------------------------------------------------------
 
+# Symbol names and image paths are encoded to UTF-8 for the char array fields.
+# In a catalog build every name and path is unique, so the cache gains nothing there;
+# it only helps bulk callers that reuse the same strings (e.g. one image for many
+# symbols), where repeated names/paths are then only transcoded once.
+@functools.lru_cache(maxsize=8192)
+def _utf8(s):
+    return s.encode('utf-8')
+
+def cstr(value):
+    """
+    Returns the text of a fixed-size char array field. ctypes already returns these
+    fields' bytes cut off at the first NUL, so there is no padding left to strip and
+    only the text itself is decoded.
+    """
+    return value.decode('utf-8')
+
+# PNG file signature, and the width/height fields of the IHDR chunk.
+# '>LL' means Big-Endian (>) Unsigned Long Long (LL, 4 bytes each)
+# The Struct is compiled once here rather than on every png_dimensions() call.
+_PNG_SIG = b'\x89PNG\r\n\x1a\n'
+_PNG_IHDR = b'IHDR'
+_PNG_WH = struct.Struct('>LL')
+
+@functools.lru_cache(maxsize=4096)
+def _png_dimensions_cached(file_path, mtime_ns):
+    """
+    Reads the (width, height) from the header of the PNG at the absolute path file_path.
+    mtime_ns is only part of the cache key, so an edited file is read again.
+    """
+    header = bytearray(24)
+    with open(file_path, 'rb') as f:
+        read_count = f.readinto(header) # Read just the first 24 bytes
+
+    # Check the whole header was read, then the PNG magic number and the IHDR chunk signature
+    # (compared in place at offset 12 rather than slicing out a copy)
+    if read_count == 24 and header.startswith(_PNG_SIG) and header.startswith(_PNG_IHDR, 12):
+        # Unpack the 4-byte width and 4-byte height from bytes 16 to 24,
+        # reading in place rather than slicing out a copy first
+        width, height = _PNG_WH.unpack_from(header, 16)
+        return width, height
+    else:
+        raise ValueError("File is not a valid PNG file or has a corrupted header.")
+
 def png_dimensions(file_path):
     """
     Reads the dimensions from a PNG file header using only standard Python libraries.
+    Results are cached by path and modification time, so a PNG that is used by
+    several symbols is only opened and read once.
     """
     try:
-        with open(file_path, 'rb') as f:
-            data = f.read(24) # Read just the first 24 bytes
-
-        # Check the PNG magic number and the IHDR chunk signature
-        if data.startswith(b'\x89PNG\r\n\x1a\n') and data[12:16] == b'IHDR':
-            # Unpack the 4-byte width and 4-byte height from bytes 16 to 24
-            # '>LL' means Big-Endian (>) Unsigned Long Long (LL, 4 bytes each)
-            width, height = struct.unpack(b'>LL', data[16:24])
-            return width, height
-        else:
-            raise ValueError("File is not a valid PNG file or has a corrupted header.")
+        abs_path = os.path.abspath(file_path)
+        return _png_dimensions_cached(abs_path, os.stat(abs_path).st_mtime_ns)
 
     except FileNotFoundError:
         print(f"Error: File not found at {file_path}", file=sys.stderr)
@@ -144,6 +187,17 @@ def png_dimensions(file_path):
         print(f"Error reading dimensions for {os.path.basename(file_path)}: {e}", file=sys.stderr)
         return None, None
 
+def png_dimensions_batch(file_paths, max_workers=8):
+    """
+    Reads the dimensions of many PNG files, returning a list of (width, height) tuples
+    in the same order as file_paths.
+    Opening and reading the files is I/O bound and releases the GIL, so the reads are
+    spread over a thread pool where their latency overlaps. Results are cached the
+    same way as png_dimensions().
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(png_dimensions, file_paths))
+
 
 #--- Class Definitions ------------------------------------------------
 
@@ -159,7 +213,54 @@ class PackedLittleEndianStructure(ctypes.LittleEndianStructure):
     # This attribute forces the compiler/ctypes to ignore standard alignment rules
     # and pack the fields exactly as defined, byte after byte.
     _pack_ = 1
-    pass
+
+    def write_into(self, buf, offset):
+        """
+        Copies this structure's bytes into a writable buffer (bytearray, mmap, ...)
+        at the given offset without creating an intermediate bytes object.
+
+        To build a file in place: size it with os.ftruncate, map it with mmap.mmap,
+        then call write_into for each structure, advancing offset by its SIZE.
+        """
+        size = ctypes.sizeof(self)
+        dest = (ctypes.c_char * size).from_buffer(buf, offset)
+        ctypes.memmove(dest, ctypes.addressof(self), size)
+        return offset + size
+
+    @classmethod
+    def view(cls, buf, offset=0):
+        """
+        Returns a structure that shares memory with the writable buffer buf (bytearray,
+        mmap, ...) at offset, so reading an existing catalog copies nothing.
+        The buffer must stay alive (and an mmap open) for as long as the view is used.
+        A read-only buffer (bytes, an ACCESS_READ mmap, ...) can't be shared, so the
+        structure gets a copy of its bytes instead.
+        """
+        with memoryview(buf) as buf_view:
+            readonly = buf_view.readonly
+        if readonly:
+            return cls.from_buffer_copy(buf, offset)
+        return cls.from_buffer(buf, offset)
+
+    @classmethod
+    def view_array(cls, buf, count, offset=0):
+        """
+        Like view(), but for count consecutive structures of this type (for example the
+        output of build_simple_symbols_bulk), parsed with a single from_buffer call.
+        """
+        return (cls * count).from_buffer(buf, offset)
+
+    @classmethod
+    def read_array(cls, f, count):
+        """
+        Reads count consecutive structures of this type from the binary file f with a
+        single readinto call, straight into a ctypes array of them.
+        """
+        records = (cls * count)()
+        read_count = f.readinto(records)
+        if read_count != ctypes.sizeof(records):
+            raise ValueError(f"short read ({read_count} of {ctypes.sizeof(records)} bytes)")
+        return records
 
 # ----------------------------------------------------------------------
 # FileID structure definition (from HEADER.CPY from FastCAD's v6 SDK)
@@ -179,6 +280,17 @@ class PackedLittleEndianStructure(ctypes.LittleEndianStructure):
 # 
 # sizeFileID	equ	128		                            ;sizeof(FileID) treats
 # ----------------------------------------------------------------------
+# Constant byte fields of FileID, built once at import rather than on every FileID()
+_FILEID_PADDING = bytes([0x0D, 0x0A, 0x1A, 0x69, 0x6E, 0x67, 0x20, 0x66, 0x69, 0x6C, 0x65, 0x2E])  # Based on real file
+_FILEID_SPECIAL = bytes([13, 10, 26])  # CR, LF, EOF
+_FILEID_FILLER = bytes([    # Based on real file analysis, not sure if it matters what goes here
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x7E, 
+    0x7E, 0x7E, 0x7E, 0x7E, 0x7E, 0x7E, 0x7E, 0x7E, 0x7E, 0x7E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
+])
+
 class FileID(PackedLittleEndianStructure):
     _fields_ = [
         ("ProgID",     ctypes.c_char * 26),  # 'FCW (FastCAD for Windows) '
@@ -198,24 +310,18 @@ class FileID(PackedLittleEndianStructure):
         self.VerText = b'6.20'
         # need to embedd a CR/LF/EOF sequence in the VerTextS field
         self.VerTextS = b'.0'
-        self.Padding = bytes([0x0D, 0x0A, 0x1A, 0x69, 0x6E, 0x67, 0x20, 0x66, 0x69, 0x6C, 0x65, 0x2E])  # Based on real file
-        self.Special = bytes([13, 10, 26])  # CR, LF, EOF
+        self.Padding = _FILEID_PADDING
+        self.Special = _FILEID_SPECIAL
         self.DBVer = 24
-        self.Filler = bytes([    # Based on real file analysis, not sure if it matters what goes here
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x7E, 
-            0x7E, 0x7E, 0x7E, 0x7E, 0x7E, 0x7E, 0x7E, 0x7E, 0x7E, 0x7E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        ])
+        self.Filler = _FILEID_FILLER
         self.Compressed = 0  # Not compressed for now, although we know how to do that if needed (it uses PKWare compression)
         self.EndMarker = 0xFF
 
     
     def __repr__(self):
         return (
-            f"FileID(ProgID='{self.ProgID.decode('utf-8').strip(chr(0))}', "
-            f"VerText='{self.VerText.decode('utf-8').strip(chr(0))}', "
+            f"FileID(ProgID='{cstr(self.ProgID)}', "
+            f"VerText='{cstr(self.VerText)}', "
             f"DBVer={self.DBVer}, Compressed={self.Compressed})"
         )
 
@@ -236,11 +342,11 @@ class CSTUFF(PackedLittleEndianStructure):
     _fields_ = [
         ("ERLen",   ctypes.c_int),          # entity record length
         ("EType",   ctypes.c_ubyte),        # entity type code
-        ("EFlags",  ctypes.c_char),         # erase/select bits
-        ("EFlags2", ctypes.c_char),         # extra flags
+        ("EFlags",  ctypes.c_ubyte),        # erase/select bits
+        ("EFlags2", ctypes.c_ubyte),        # extra flags
         ("EColor",  ctypes.c_ubyte),        # entity color
         ("EColor2", ctypes.c_ubyte),        # fill (2nd) color
-        ("EThick",  ctypes.c_char),         # pen thickness 0..25.4 mm
+        ("EThick",  ctypes.c_ubyte),        # pen thickness 0..25.4 mm
         ("WPlane",  ctypes.c_short),        # workplane (0 = XY plane)
         ("ELayer",  ctypes.c_short),        # layer
         ("ELStyle", ctypes.c_short),        # line style (0=solid)
@@ -252,32 +358,55 @@ class CSTUFF(PackedLittleEndianStructure):
 
     def __init__(self, len, type, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # Copy in the default values common in CC3+ with a single memmove from the
+        # prebuilt template, then set the two fields that vary per entity.
+        ctypes.memmove(ctypes.addressof(self), _CSTUFF_TEMPLATE, CSTUFF.SIZE)
         self.ERLen = len
         self.EType = type
+
+    @staticmethod
+    def _assign_defaults(cstuff):
         # Assign default values common in CC3+
-        self.EFlags = b'\x00'
-        self.EFlags2 = b'\x00'
-        self.EColor = 224
-        self.EColor2 = 224
-        self.EThick = b'\x00'
-        self.WPlane = 0
-        self.ELayer = 256
-        self.ELStyle = 0
-        self.GroupID = 0
-        self.EFStyle = 1
-        self.LWidth = 0.0
-        self.Tag = 0  # TODO: Assign unique tags as needed?  Currently using 0 works, but not sure whether CC3+ is detecting that and assigning a real tag later. Need to check the debugger to confirm.
+        cstuff.EFlags = 0
+        cstuff.EFlags2 = 0
+        cstuff.EColor = 224
+        cstuff.EColor2 = 224
+        cstuff.EThick = 0
+        cstuff.WPlane = 0
+        cstuff.ELayer = 256
+        cstuff.ELStyle = 0
+        cstuff.GroupID = 0
+        cstuff.EFStyle = 1
+        cstuff.LWidth = 0.0
+        cstuff.Tag = 0  # TODO: Assign unique tags as needed?  Currently using 0 works, but not sure whether CC3+ is detecting that and assigning a real tag later. Need to check the debugger to confirm.
 
 
     def __repr__(self):
+        # Read every field in one unpack rather than through a dozen ctypes attribute lookups
+        (erlen, etype, eflags, eflags2, ecolor, ecolor2, ethick, wplane,
+         elayer, elstyle, groupid, efstyle, lwidth, tag) = _CSTUFF_STRUCT.unpack_from(self)
         return (
-            f"CSTUFF(ERLen={self.ERLen}, EType={self.EType}, EFlags={ord(self.EFlags)}, "
-            f"EFlags2={ord(self.EFlags2)}, "
-            f"EColor={self.EColor}, EColor2={self.EColor2}, Ethick={self.EThick}, WPlane={self.WPlane}, "
-            f"ELayer={self.ELayer}, ELStyle={self.ELStyle}, GroupID={self.GroupID}, "
-            f"EFStyle={self.EFStyle}, LWidth={self.LWidth}, Tag={self.Tag})"
+            f"CSTUFF(ERLen={erlen}, EType={etype}, EFlags={eflags}, "
+            f"EFlags2={eflags2}, "
+            f"EColor={ecolor}, EColor2={ecolor2}, Ethick={ethick}, WPlane={wplane}, "
+            f"ELayer={elayer}, ELStyle={elstyle}, GroupID={groupid}, "
+            f"EFStyle={efstyle}, LWidth={lwidth}, Tag={tag})"
         )
 
+# Size cached at class definition so constructors needn't call ctypes.sizeof() each time
+CSTUFF.SIZE = ctypes.sizeof(CSTUFF)
+
+# struct layout matching CSTUFF's _fields_, used by CSTUFF.__repr__
+_CSTUFF_STRUCT = struct.Struct('<iBBBBBBhhhhhfi')
+assert _CSTUFF_STRUCT.size == CSTUFF.SIZE
+
+# Snapshot of a CSTUFF holding the default values, built once at import time.
+# __new__ gives a zero-filled instance without running __init__.
+_cstuff_defaults = CSTUFF.__new__(CSTUFF)
+CSTUFF._assign_defaults(_cstuff_defaults)
+_CSTUFF_TEMPLATE = bytes(_cstuff_defaults)
+del _cstuff_defaults
+
 class GPOINT3(PackedLittleEndianStructure):
     _fields_ = [
         ("x", ctypes.c_float),
@@ -307,7 +436,7 @@ class SYMDEF(PackedLittleEndianStructure):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         
-        CSTUFF.__init__(self.CStuff, ctypes.sizeof(SYMDEF), ET_SYMDEF)
+        CSTUFF.__init__(self.CStuff, SYMDEF.SIZE, ET_SYMDEF)
     
     def __repr__(self):
         return (
@@ -316,10 +445,12 @@ class SYMDEF(PackedLittleEndianStructure):
             f"  Low={self.Low!r},\n"
             f"  Hi={self.Hi!r},\n"
             f"  Flags={self.Flags},\n"
-            f"  SName='{self.SName.decode('utf-8').strip(chr(0))}'\n"
+            f"  SName='{cstr(self.SName)}'\n"
             f")"
         )
 
+SYMDEF.SIZE = ctypes.sizeof(SYMDEF)
+
 class Marker(PackedLittleEndianStructure):
     _fields_ = [
         ("ERLen", ctypes.c_uint32), 
@@ -330,12 +461,14 @@ class Marker(PackedLittleEndianStructure):
         super().__init__(*args, **kwargs)
         
         # Set the length field to the total size of the structure in bytes
-        self.ERLen = ctypes.sizeof(Marker) # Which is 5 bytes
+        self.ERLen = Marker.SIZE # Which is 5 bytes
         self.MType = m_type_value
     
     def __repr__(self):
         return f"Marker(ERLen={self.ERLen}, MType={self.MType})"
 
+Marker.SIZE = ctypes.sizeof(Marker)
+
 class Marker0(Marker):
     def __init__(self, *args, **kwargs):
         # Call the parent's init, passing 0 as the specific MType value
@@ -386,21 +519,46 @@ class PICTR(PackedLittleEndianStructure):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         
-        CSTUFF.__init__(self.CStuff, ctypes.sizeof(PICTR), ET_XP)
+        CSTUFF.__init__(self.CStuff, PICTR.SIZE, ET_XP)
         self.XPId = XPID_PICTR
         self.XType = XT_PICTR
         self.Version = PICTR_VERSION
         self.Flags = PF_NO_OUTLINE | PF_RESINFO_ONLY1 | PF_RESINFO_VALID
         self.Mode = IMGXFRMODE.IMGX_ALPHA 
 
+    def snapshot(self):
+        """
+        Returns the PICTR fields after CStuff as a PICTRFields namedtuple of plain Python
+        values, read with a single struct unpack. Reading a field from the tuple is much
+        cheaper than through the ctypes descriptor, so use this when fields are read
+        repeatedly. It is a copy: later changes to the PICTR are not reflected in it.
+        """
+        return PICTRFields(*_PICTR_FIELDS_STRUCT.unpack_from(self, PICTR.XPId.offset),
+                           list(_RESINFO_STRUCT.iter_unpack(self.ResInfo)),
+                           cstr(self.BMPName))
+
     def __repr__(self):
-        name = self.BMPName.decode('utf-8')
+        name = cstr(self.BMPName)
         return (
             f"PICTR(XPId={self.XPId}, Version={self.Version}, "
             f"Bearing={self.Bearing:.2f}, Alpha={self.Alpha}, "
             f"BMPName='{name}')"
         )
 
+PICTR.SIZE = ctypes.sizeof(PICTR)
+assert PICTR.SIZE == 511   # odd-sized, so it depends on _pack_ = 1
+
+# Layout of the PICTR fields from XPId through Alpha (Cen is split into CenX, CenY), for PICTR.snapshot()
+_PICTR_FIELDS_STRUCT = struct.Struct('<HcIIIIIfffffIi')
+assert _PICTR_FIELDS_STRUCT.size == PICTR.ResInfo.offset - PICTR.XPId.offset
+
+# Layout of one RESINFO, for reading the whole ResInfo array in one pass
+_RESINFO_STRUCT = struct.Struct('<iII')
+assert _RESINFO_STRUCT.size == ctypes.sizeof(RESINFO)
+
+PICTRFields = namedtuple('PICTRFields',
+    'XPId XType Version Flags Mode bmwid bmhgt CenX CenY Bearing RWid RHgt TColor Alpha ResInfo BMPName')
+
 class SYMINFO(PackedLittleEndianStructure):
     _fields_ = [
         ("CStuff",         CSTUFF),               # entity properties
@@ -442,15 +600,15 @@ class SYMINFO(PackedLittleEndianStructure):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         
-        CSTUFF.__init__(self.CStuff, ctypes.sizeof(SYMINFO), ET_XP)
+        CSTUFF.__init__(self.CStuff, SYMINFO.SIZE, ET_XP)
         self.XPId = XPID_SYMINFO
         self.XType = XT_SYMINFO
         self.Version = SYMINFO_VERSION
 
     def __repr__(self):
         # Decode specific string fields
-        sheet_name = self.Sheet.decode('utf-8').strip(chr(0))
-        tool_name = self.DrawToolName.decode('utf-8').strip(chr(0))
+        sheet_name = cstr(self.Sheet)
+        tool_name = cstr(self.DrawToolName)
         
         return (
             f"SYMINFO(\n"
@@ -461,6 +619,9 @@ class SYMINFO(PackedLittleEndianStructure):
             f")"
         )
 
+SYMINFO.SIZE = ctypes.sizeof(SYMINFO)
+assert SYMINFO.SIZE == 406   # odd-sized, so it depends on _pack_ = 1
+
 # ----------------------------------------------------------------------
 # The Simple Symbol Definition Structure
 #
@@ -482,45 +643,59 @@ class SimpleSymbol(PackedLittleEndianStructure):
 
     def __init__(self, name, file, isGroup, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        
-        SYMDEF.__init__(self.symbol_definition)
-        self.symbol_definition.SName = name.encode('utf-8')
+
+        # Copy in all the default sub-structure values from the prebuilt template
+        # (see _assign_defaults) with a single memmove, then fill in this symbol's fields.
+        # The grouped template already has the SYMINFO group flags set.
+        template = _SIMPLE_GROUPED_TEMPLATE if isGroup else _SIMPLE_TEMPLATE
+        ctypes.memmove(ctypes.addressof(self), template, SimpleSymbol.SIZE)
+
+        self.symbol_definition.SName = _utf8(name)
         x, y = png_dimensions(file)
         self.symbol_definition.Hi.x = float(x)/40
         self.symbol_definition.Hi.y = float(y)/40
-        self.symbol_definition.Hi.z = float(0)
-        self.symbol_definition.Low.x = float(0)
-        self.symbol_definition.Low.y = float(0)
-        self.symbol_definition.Low.z = float(0)
-
-        Marker0.__init__(self.start_marker)
+        # Hi.z and Low are all 0.0, which the template already holds (ctypes zero-fills)
 
-        PICTR.__init__(self.picture_info)
-        self.picture_info.BMPName = file.encode('utf-8')
+        self.picture_info.BMPName = _utf8(file)
         self.picture_info.RWid = float(x)/40
         self.picture_info.RHgt = float(y)/40
 
-        SYMINFO.__init__(self.symbol_info)
-        self.symbol_info.ScaleAX = 1.0
-        self.symbol_info.ScaleAY = 1.0
-        self.symbol_info.ScaleBX = 1.0
-        self.symbol_info.ScaleBY = 1.0
-        if isGroup:
-            self.symbol_info.Flags |= SF_GROUPED
-            self.symbol_info.GFlags |=  SGF_RANDOM
+    @staticmethod
+    def _assign_defaults(symbol):
+        SYMDEF.__init__(symbol.symbol_definition)
+        Marker0.__init__(symbol.start_marker)
+        PICTR.__init__(symbol.picture_info)
 
-        Marker1.__init__(self.end_marker)
+        SYMINFO.__init__(symbol.symbol_info)
+        symbol.symbol_info.ScaleAX = 1.0
+        symbol.symbol_info.ScaleAY = 1.0
+        symbol.symbol_info.ScaleBX = 1.0
+        symbol.symbol_info.ScaleBY = 1.0
+
+        Marker1.__init__(symbol.end_marker)
 
     def __repr__(self):
         return (
             f"SimpleSymbol(\n"
-            f"  Symbol Name: '{self.symbol_definition.SName.decode('utf-8').strip(chr(0))}',\n"
+            f"  Symbol Name: '{cstr(self.symbol_definition.SName)}',\n"
             f"  Start Marker MType: {self.start_marker.MType},\n"
-            f"  Picture BMP Name: '{self.picture_info.BMPName.decode('utf-8').strip(chr(0))}',\n"
+            f"  Picture BMP Name: '{cstr(self.picture_info.BMPName)}',\n"
             f"  End Marker MType: {self.end_marker.MType}\n"
             f")"
         )
 
+SimpleSymbol.SIZE = ctypes.sizeof(SimpleSymbol)
+
+# Snapshots of a SimpleSymbol holding all the default values, built once at import time:
+# one as is, and one with the flags of a symbol that is part of a symbol group
+_simple_defaults = SimpleSymbol.__new__(SimpleSymbol)
+SimpleSymbol._assign_defaults(_simple_defaults)
+_SIMPLE_TEMPLATE = bytes(_simple_defaults)
+_simple_defaults.symbol_info.Flags |= SF_GROUPED
+_simple_defaults.symbol_info.GFlags |= SGF_RANDOM
+_SIMPLE_GROUPED_TEMPLATE = bytes(_simple_defaults)
+del _simple_defaults
+
 # ----------------------------------------------------------------------
 # The Varicolor Symbol Definition Structure
 # 
@@ -545,54 +720,242 @@ class VaricolorSymbol(PackedLittleEndianStructure):
 
     def __init__(self, name, file1, file2, isGroup, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        
-        SYMDEF.__init__(self.symbol_definition)
-        self.symbol_definition.SName = name.encode('utf-8')
+
+        # Copy in all the default sub-structure values from the prebuilt template
+        # (see _assign_defaults) with a single memmove, then fill in this symbol's fields.
+        # The grouped template already has the SYMINFO group flags set.
+        template = _VARICOLOR_GROUPED_TEMPLATE if isGroup else _VARICOLOR_TEMPLATE
+        ctypes.memmove(ctypes.addressof(self), template, VaricolorSymbol.SIZE)
+
+        self.symbol_definition.SName = _utf8(name)
         x, y = png_dimensions(file1)
         self.symbol_definition.Hi.x = float(x)/40
         self.symbol_definition.Hi.y = float(y)/40
-        self.symbol_definition.Hi.z = float(0)
-        self.symbol_definition.Low.x = float(0)
-        self.symbol_definition.Low.y = float(0)
-        self.symbol_definition.Low.z = float(0)
+        # Hi.z and Low are all 0.0, which the template already holds (ctypes zero-fills)
 
-        Marker0.__init__(self.start_marker)
-        
-        PICTR.__init__(self.picture1_info)
-        self.picture1_info.BMPName = file1.encode('utf-8')
+        self.picture1_info.BMPName = _utf8(file1)
         self.picture1_info.RWid = float(x)/40
         self.picture1_info.RHgt = float(y)/40
         
-        PICTR.__init__(self.picture2_info)
-        self.picture2_info.BMPName = file2.encode('utf-8')
+        self.picture2_info.BMPName = _utf8(file2)
         x, y = png_dimensions(file2)
         self.picture2_info.RWid = float(x)/40
         self.picture2_info.RHgt = float(y)/40
-        self.picture2_info.CStuff.EFlags = EF_CSREF   # This is needed to make the 2nd PNG the varicolor mask
-        
-        SYMINFO.__init__(self.symbol_info)
-        self.symbol_info.Flags = SF_VARICOLOR
-        self.symbol_info.ScaleAX = 1.0
-        self.symbol_info.ScaleAY = 1.0
-        self.symbol_info.ScaleBX = 1.0
-        self.symbol_info.ScaleBY = 1.0
-        if isGroup:
-            self.symbol_info.Flags |= SF_GROUPED
-            self.symbol_info.GFlags |= SGF_VARICOLOR | SGF_RANDOM
-        
-        Marker1.__init__(self.end_marker)
+
+    @staticmethod
+    def _assign_defaults(symbol):
+        SYMDEF.__init__(symbol.symbol_definition)
+        Marker0.__init__(symbol.start_marker)
+        PICTR.__init__(symbol.picture1_info)
+
+        PICTR.__init__(symbol.picture2_info)
+        symbol.picture2_info.CStuff.EFlags = EF_CSREF   # This is needed to make the 2nd PNG the varicolor mask
+
+        SYMINFO.__init__(symbol.symbol_info)
+        symbol.symbol_info.Flags = SF_VARICOLOR
+        symbol.symbol_info.ScaleAX = 1.0
+        symbol.symbol_info.ScaleAY = 1.0
+        symbol.symbol_info.ScaleBX = 1.0
+        symbol.symbol_info.ScaleBY = 1.0
+
+        Marker1.__init__(symbol.end_marker)
 
     def __repr__(self):
         return (
             f"VaricolorSymbol(\n"
-            f"  Symbol Name: '{self.symbol_definition.SName.decode('utf-8').strip(chr(0))}',\n"
+            f"  Symbol Name: '{cstr(self.symbol_definition.SName)}',\n"
             f"  Start Marker MType: {self.start_marker.MType},\n"
-            f"  Picture BMP1 Name: '{self.picture1_info.BMPName.decode('utf-8').strip(chr(0))}',\n"
-            f"  Picture BMP2 Name: '{self.picture2_info.BMPName.decode('utf-8').strip(chr(0))}',\n"
+            f"  Picture BMP1 Name: '{cstr(self.picture1_info.BMPName)}',\n"
+            f"  Picture BMP2 Name: '{cstr(self.picture2_info.BMPName)}',\n"
             f"  End Marker MType: {self.end_marker.MType}\n"
             f")"
         )
 
+VaricolorSymbol.SIZE = ctypes.sizeof(VaricolorSymbol)
+
+# Snapshots of a VaricolorSymbol holding all the default values, built once at import time:
+# one as is, and one with the flags of a symbol that is part of a symbol group
+_varicolor_defaults = VaricolorSymbol.__new__(VaricolorSymbol)
+VaricolorSymbol._assign_defaults(_varicolor_defaults)
+_VARICOLOR_TEMPLATE = bytes(_varicolor_defaults)
+_varicolor_defaults.symbol_info.Flags |= SF_GROUPED
+_varicolor_defaults.symbol_info.GFlags |= SGF_VARICOLOR | SGF_RANDOM
+_VARICOLOR_GROUPED_TEMPLATE = bytes(_varicolor_defaults)
+del _varicolor_defaults
+
+#--- Bulk Symbol Generation -------------------------------------------
+
+# Offsets (from the start of a SimpleSymbol) of the fields that differ from one symbol
+# to the next, taken from the ctypes field descriptors so they always match the layout.
+_SIMPLE_SNAME_OFFSET = SimpleSymbol.symbol_definition.offset + SYMDEF.SName.offset
+_SIMPLE_HI_OFFSET = SimpleSymbol.symbol_definition.offset + SYMDEF.Hi.offset
+_SIMPLE_BMPNAME_OFFSET = SimpleSymbol.picture_info.offset + PICTR.BMPName.offset
+_SIMPLE_RSIZE_OFFSET = SimpleSymbol.picture_info.offset + PICTR.RWid.offset   # RWid, RHgt
+
+_FLOAT_PAIR = struct.Struct('<ff')
+
+def _pack_char_array(buf, offset, value, size):
+    """
+    Copies the bytes value into the fixed-size char array field at offset in buf.
+    Like assigning to the ctypes field, a value longer than the field is an error.
+    """
+    if len(value) > size:
+        raise ValueError(f"bytes too long ({len(value)}, maximum length {size})")
+    buf[offset:offset + len(value)] = value
+
+def pack_simple_into(buf, offset, name, file, x, y, is_group):
+    """
+    Writes the bytes of SimpleSymbol(name, file, is_group) into the writable buffer buf
+    at offset, for an image that is x by y pixels, and returns the offset just past it.
+    This is a write-only path: no ctypes object is created, so there is nothing to
+    modify afterwards, and the image dimensions are passed in rather than read here.
+    Like write_into, raises ValueError if the symbol doesn't fit in buf at offset
+    (slice assignment alone would silently grow a bytearray instead).
+    """
+    end = offset + SimpleSymbol.SIZE
+    if offset < 0 or end > len(buf):
+        raise ValueError(f"symbol ({SimpleSymbol.SIZE} bytes) does not fit in buffer ({len(buf)} bytes) at offset {offset}")
+
+    width = float(x)/40
+    height = float(y)/40
+
+    buf[offset:end] = _SIMPLE_GROUPED_TEMPLATE if is_group else _SIMPLE_TEMPLATE
+    _pack_char_array(buf, offset + _SIMPLE_SNAME_OFFSET, _utf8(name), SYMDEF.SName.size)
+    _FLOAT_PAIR.pack_into(buf, offset + _SIMPLE_HI_OFFSET, width, height)
+    _pack_char_array(buf, offset + _SIMPLE_BMPNAME_OFFSET, _utf8(file), PICTR.BMPName.size)
+    _FLOAT_PAIR.pack_into(buf, offset + _SIMPLE_RSIZE_OFFSET, width, height)
+
+    return end
+
+def build_simple_symbols_bulk(names, files, is_groups):
+    """
+    Builds a SimpleSymbol for each (name, file, isGroup) and returns them all as one
+    contiguous bytearray, ready to be written to an FSC file.
+    The result is the same as joining bytes(SimpleSymbol(name, file, isGroup)) for each
+    symbol, but no ctypes objects are created: each symbol is packed into place with
+    pack_simple_into().
+    Raises ValueError if names, files and is_groups are not all the same length.
+    """
+    if not len(names) == len(files) == len(is_groups):
+        raise ValueError(f"names, files and is_groups differ in length "
+                         f"({len(names)}, {len(files)}, {len(is_groups)})")
+
+    dimensions = png_dimensions_batch(files)
+
+    buf = bytearray(SimpleSymbol.SIZE * len(names))
+    offset = 0
+    for name, file, is_group, (x, y) in zip(names, files, is_groups, dimensions):
+        offset = pack_simple_into(buf, offset, name, file, x, y, is_group)
+
+    return buf
+
+#--- Reading FSC Files -----------------------------------------------
+
+class FSCReader:
+    """
+    Memory-maps an existing FSC file so its structures can be viewed in place,
+    without reading the file into memory or copying each record out of it.
+
+    The mapping is copy-on-write: views can be modified, but changes are never
+    written back to the file. Views share the mapping's memory and keep it alive, so
+    they stay usable after close(); the mapping is released with the last of them.
+
+    Example:
+     with FSCReader("Symbols.FSC") as reader:
+         file_id = reader.struct_at(FileID, 0)
+     print(file_id)
+    """
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        # Records are normally scanned front to back (not available on Windows)
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            self._mm.madvise(mmap.MADV_SEQUENTIAL)
+
+    def _mapping(self):
+        if self._mm is None:
+            raise ValueError("FSCReader is closed")
+        return self._mm
+
+    def __len__(self):
+        return len(self._mapping())
+
+    def struct_at(self, cls, offset):
+        """Returns a cls structure viewing the file's bytes at offset."""
+        return cls.view(self._mapping(), offset)
+
+    def close(self):
+        """
+        Closes the reader. If views returned by struct_at still exist the mapping
+        can't be unmapped yet, so it is only dropped here and unmapped once the last
+        view is garbage collected.
+        """
+        if self._mm is None:
+            return
+        try:
+            self._mm.close()
+        except BufferError:
+            pass    # Views still hold the mapping
+        self._mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+# ERLen, the record length at the start of every entity (CStuff.ERLen, or Marker.ERLen)
+_ERLEN = struct.Struct('<i')
+_ERLEN_OFFSET = CSTUFF.ERLen.offset
+
+@functools.lru_cache(maxsize=None)
+def _leading_erlen_size(cls):
+    """
+    Returns the ERLen value expected at the start of a cls record: the size of the
+    entity that begins it. That is cls itself for an entity (starting with CStuff or
+    ERLen), or the first entity nested in it for a composite such as SimpleSymbol,
+    which starts with its SYMDEF. Raises TypeError if cls does not begin with an entity.
+    """
+    first_name, first_type = cls._fields_[0][:2]
+    if first_name in ('ERLen', 'CStuff'):
+        return ctypes.sizeof(cls)
+    if issubclass(first_type, ctypes.Structure):
+        return _leading_erlen_size(first_type)
+    raise TypeError(f"{cls.__name__} does not start with an entity record length (ERLen)")
+
+def erlen_matches(cls, buf, offset=0):
+    """
+    Checks whether the cls record at offset in buf has the ERLen expected for it
+    (see _leading_erlen_size), reading just that field rather than building a cls
+    structure first. Useful as a quick check before committing to a full parse.
+    """
+    erlen, = _ERLEN.unpack_from(buf, offset + _ERLEN_OFFSET)
+    return erlen == _leading_erlen_size(cls)
+
+def validate_erlen(records, expected_size=None):
+    """
+    Checks that every record in a ctypes array of records (for example from view_array
+    or read_array) has an ERLen equal to expected_size. This defaults to the size of the
+    entity that starts each record: the record type itself for an entity, or e.g. the
+    SYMDEF at the start of each SimpleSymbol. Raises ValueError naming the first record
+    that doesn't match, or TypeError if the record type does not start with an ERLen.
+
+    ERLen is the first field of every entity, so byte k of it sits at k, k+size,
+    k+2*size, ... and each of its 4 bytes is compared for all the records at once
+    with a strided slice, rather than reading ERLen record by record.
+    """
+    size = ctypes.sizeof(records._type_)
+    if expected_size is None:
+        expected_size = _leading_erlen_size(records._type_)
+    data = memoryview(records).cast('B')
+    expected = expected_size.to_bytes(4, 'little', signed=True)
+    if all(data[k::size] == expected[k:k + 1] * len(records) for k in range(4)):
+        return
+    for i in range(len(records)):
+        erlen = int.from_bytes(data[i * size:i * size + 4], 'little', signed=True)
+        if erlen != expected_size:
+            raise ValueError(f"record {i}: ERLen is {erlen}, expected {expected_size}")
+
 # --- Test Code ---
 # This block will ONLY run if you execute this file directly, which is not the normal use case.
 # This is just for testing purposes for confirming different data structures were built correctly.
@@ -618,8 +981,8 @@ if __name__ == "__main__":
     #############################################################
 
     # Create an instance of the structure in Python
-    entity = CSTUFF(ctypes.sizeof(CSTUFF), 5)
-    entity.EFlags = b'\x01' # Char fields expect bytes type input in Python 3
+    entity = CSTUFF(CSTUFF.SIZE, 5)
+    entity.EFlags = 1
     entity.EColor = 255
     entity.WPlane = 0
     entity.ELayer = 10
@@ -630,7 +993,7 @@ if __name__ == "__main__":
     print(f"Structure instance: {entity}")
 
     # Print the total size of the structure in bytes
-    print(f"Size of CSTUFF structure: {ctypes.sizeof(CSTUFF)} bytes")
+    print(f"Size of CSTUFF structure: {CSTUFF.SIZE} bytes")
 
     # To treat the structure as raw bytes (e.g., to write to a file or send over a socket):
     raw_bytes = bytes(entity)
@@ -657,7 +1020,7 @@ if __name__ == "__main__":
     print(symbol_def)
     raw_bytes = bytes(symbol_def)
     print(f"Raw bytes representation: {raw_bytes[:88].hex()}")
-    print(f"\nTotal size of SYMDEF structure: {ctypes.sizeof(SYMDEF)} bytes")
+    print(f"\nTotal size of SYMDEF structure: {SYMDEF.SIZE} bytes")
 
     #############################################################
 
@@ -678,7 +1041,7 @@ if __name__ == "__main__":
     # Assigning a string to the fixed-size char array using .value
     pic.BMPName = b"C:\\images\\floorplan.bmp"
 
-    print(f"Total size of PICTR structure (packed): {ctypes.sizeof(PICTR)} bytes")
+    print(f"Total size of PICTR structure (packed): {PICTR.SIZE} bytes")
     print("\nInitialized PICTR object:")
     print(pic)
     
@@ -688,7 +1051,7 @@ if __name__ == "__main__":
     # Assertions for basic verification
     assert pic.Cen.x == 150.25
     assert pic.BMPName == b"C:\\images\\floorplan.bmp"
-    assert ctypes.sizeof(PICTR) == 511
+    assert PICTR.SIZE == 511
     print("\nAssertions passed.")
 
     #############################################################
@@ -705,126 +1068,131 @@ if __name__ == "__main__":
     sym.Sheet = b"First Floor Plan"
     sym.DrawToolName = b"Advanced Symbol Tool v2"
 
-    print(f"Total size of SYMINFO structure (packed): {ctypes.sizeof(SYMINFO)} bytes")
+    print(f"Total size of SYMINFO structure (packed): {SYMINFO.SIZE} bytes")
     print("\nInitialized SYMINFO object:")
     print(sym)
 
     ### PICTR analysis from a bytes array dump
-    data = bytes([
-        0xFF, 0x01, 0x00, 0x00, 0x04, 0x08, 0x00, 0xE0, 0xE0, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 
-        0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0E, 0x2C, 0x00, 0x00, 0x04, 0xA0, 0x01, 0x00, 
-        0x00, 0x00, 0x00, 0x0D, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x66, 0x66, 0x59, 0x41, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x66, 
-        0x66, 0x59, 0x41, 0x33, 0x33, 0x4F, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x43, 
-        0x3A, 0x5C, 0x55, 0x73, 0x65, 0x72, 0x73, 0x5C, 0x6E, 0x6F, 0x73, 0x70, 0x61, 0x5C, 0x44, 0x6F, 
-        0x77, 0x6E, 0x6C, 0x6F, 0x61, 0x64, 0x73, 0x5C, 0x68, 0x65, 0x72, 0x65, 0x2D, 0x74, 0x68, 0x65, 
-        0x72, 0x65, 0x2D, 0x62, 0x65, 0x2D, 0x6D, 0x6F, 0x6E, 0x73, 0x74, 0x65, 0x72, 0x73, 0x2D, 0x31, 
-        0x2E, 0x31, 0x5C, 0x48, 0x65, 0x72, 0x65, 0x20, 0x54, 0x68, 0x65, 0x72, 0x65, 0x20, 0x42, 0x65, 
-        0x20, 0x4D, 0x6F, 0x6E, 0x73, 0x74, 0x65, 0x72, 0x73, 0x20, 0x31, 0x2E, 0x31, 0x5C, 0x50, 0x4E, 
-        0x47, 0x5C, 0x57, 0x6F, 0x6F, 0x64, 0x70, 0x65, 0x63, 0x6B, 0x65, 0x72, 0x20, 0x57, 0x68, 0x61, 
-        0x6C, 0x65, 0x20, 0x76, 0x61, 0x72, 0x69, 0x5F, 0x30, 0x32, 0x2E, 0x70, 0x6E, 0x67, 0x00, 0x00, 
-        0x6E, 0x67, 0x00, 0x67, 0x00, 0x6E, 0x67, 0x00, 0x6E, 0x67, 0x00, 0x00, 0x00, 0x67, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    ])
-    pic_from_data = PICTR.from_buffer_copy(data)
+    data = bytearray.fromhex("""
+        FF 01 00 00 04 08 00 E0 E0 00 00 00 00 01 00 00
+        00 00 01 00 00 00 00 00 0E 2C 00 00 04 A0 01 00
+        00 00 00 0D 00 00 00 02 00 00 00 00 00 00 00 00
+        00 00 00 66 66 59 41 00 00 00 00 00 00 00 00 66
+        66 59 41 33 33 4F 40 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 43
+        3A 5C 55 73 65 72 73 5C 6E 6F 73 70 61 5C 44 6F
+        77 6E 6C 6F 61 64 73 5C 68 65 72 65 2D 74 68 65
+        72 65 2D 62 65 2D 6D 6F 6E 73 74 65 72 73 2D 31
+        2E 31 5C 48 65 72 65 20 54 68 65 72 65 20 42 65
+        20 4D 6F 6E 73 74 65 72 73 20 31 2E 31 5C 50 4E
+        47 5C 57 6F 6F 64 70 65 63 6B 65 72 20 57 68 61
+        6C 65 20 76 61 72 69 5F 30 32 2E 70 6E 67 00 00
+        6E 67 00 67 00 6E 67 00 6E 67 00 00 00 67 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+    """)
+    pic_from_data = PICTR.view(data)
     print(f"\nPICTR created from byte array dump:")
-    # Print out every field for verification
-    print(pic_from_data.CStuff)
-    print(f"XPId: {pic_from_data.XPId}")
-    print(f"BMPName: {pic_from_data.BMPName.decode('utf-8').strip(chr(0))}")
-    print(f"Version: {pic_from_data.Version}")
-    print(f"Flags: {pic_from_data.Flags}")
-    print(f"Mode: {pic_from_data.Mode}")
-    print(f"bmwid: {pic_from_data.bmwid}")
-    print(f"bmhgt: {pic_from_data.bmhgt}")
-    print(f"Cen: {pic_from_data.Cen}")
-    print(f"Bearing: {pic_from_data.Bearing}")
-    print(f"RWid: {pic_from_data.RWid}")
-    print(f"RHgt: {pic_from_data.RHgt}")
-    print(f"TColor: {pic_from_data.TColor}")
-    print(f"Alpha: {pic_from_data.Alpha}")
-    for i, res in enumerate(pic_from_data.ResInfo):
-        print(f"ResInfo[{i}]: {res}")
-    print(f"Reserve (first 8 DWORDs): {[hex(x) for x in pic_from_data.Reserve[:8]]}")
-
-    print(f"\nTotal size of PICTR structure from data: {ctypes.sizeof(PICTR)} bytes")
-    assert pic_from_data.CStuff.ERLen == ctypes.sizeof(PICTR)
+    # Print out every field for verification, written out in one go
+    pic_fields = pic_from_data.snapshot()
+    sys.stdout.write("\n".join([
+        f"{pic_from_data.CStuff}",
+        f"XPId: {pic_fields.XPId}",
+        f"BMPName: {pic_fields.BMPName}",
+        f"Version: {pic_fields.Version}",
+        f"Flags: {pic_fields.Flags}",
+        f"Mode: {pic_fields.Mode}",
+        f"bmwid: {pic_fields.bmwid}",
+        f"bmhgt: {pic_fields.bmhgt}",
+        f"Cen: GPOINT2(x={pic_fields.CenX}, y={pic_fields.CenY})",
+        f"Bearing: {pic_fields.Bearing}",
+        f"RWid: {pic_fields.RWid}",
+        f"RHgt: {pic_fields.RHgt}",
+        f"TColor: {pic_fields.TColor}",
+        f"Alpha: {pic_fields.Alpha}",
+        f"ResInfo (Present, width, height): {pic_fields.ResInfo}",
+        f"Reserve (first 8 DWORDs, raw bytes): {bytes(pic_from_data.Reserve)[:32].hex(' ', 4)}",
+    ]) + "\n")
+
+    print(f"\nTotal size of PICTR structure from data: {PICTR.SIZE} bytes")
+    assert pic_from_data.CStuff.ERLen == PICTR.SIZE
+    assert erlen_matches(PICTR, data)
     #############################################################
     # SYMINFO from bytes dump
-    data = bytes([
-        0x96, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0xE0, 0xE0, 0x00, 0x00, 0x00, 0x07, 0x01, 0x00, 0x00, 
-        0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x73, 0x2C, 0x00, 0x00, 0x0B, 0xA0, 0x61, 0x01, 
-        0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0x3F, 0x00, 0x00, 0x80, 0x3F, 0x00, 0x00, 0x80, 
-        0x3F, 0x00, 0x00, 0x80, 0x3F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    ])
-
-    sym_from_data = SYMINFO.from_buffer_copy(data)
+    data = bytearray.fromhex("""
+        96 01 00 00 04 00 00 E0 E0 00 00 00 07 01 00 00
+        00 00 01 00 00 00 00 00 73 2C 00 00 0B A0 61 01
+        00 04 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 80 3F 00 00 80 3F 00 00 80
+        3F 00 00 80 3F 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
+        00 00 00 00 00 00
+    """)
+
+    sym_from_data = SYMINFO.view(data)
     print(f"\nSYMINFO created from byte array dump:")
     # Print out every field for verification
-    print(sym_from_data)
-    print(f"\nTotal size of SYMINFO structure from data: {ctypes.sizeof(SYMINFO)} bytes")
-    print(sym_from_data.CStuff)
-    print(f"XPId: {sym_from_data.XPId}")
-    print(f"Version: {sym_from_data.Version}")
-    print(f"Flags: {hex(sym_from_data.Flags)}")
-    print(f"Flags2: {hex(sym_from_data.Flags2)}")
-    print(f"RotA: {sym_from_data.RotA}")
-    print(f"RotB: {sym_from_data.RotB}")
-    print(f"TFlags: {hex(sym_from_data.TFlags)}")
-    print(f"ScaleAX: {sym_from_data.ScaleAX}")
-    print(f"ScaleBX: {sym_from_data.ScaleBX}")
-    print(f"ScaleAY: {sym_from_data.ScaleAY}")
-    print(f"ScaleBY: {sym_from_data.ScaleBY}")
-    print(f"ShearA: {sym_from_data.ShearA}")
-    print(f"ShearB: {sym_from_data.ShearB}")
-    print(f"OffsetHiX: {sym_from_data.OffsetHiX}")
-    print(f"OffsetHiY: {sym_from_data.OffsetHiY}")
-    print(f"OffsetLowX: {sym_from_data.OffsetLowX}")
-    print(f"OffsetLowY: {sym_from_data.OffsetLowY}")
-    print(f"GFlags: {hex(sym_from_data.GFlags)}")
-    print(f"Sheet: {sym_from_data.Sheet.decode('utf-8').strip(chr(0))}")
-    print(f"DrawToolName: {sym_from_data.DrawToolName.decode('utf-8').strip(chr(0))}")
-    assert sym_from_data.CStuff.ERLen == ctypes.sizeof(SYMINFO)
+    print(f"\nTotal size of SYMINFO structure from data: {SYMINFO.SIZE} bytes")
+    sys.stdout.write("\n".join([
+        f"{sym_from_data.CStuff}",
+        f"XPId: {sym_from_data.XPId}",
+        f"Version: {sym_from_data.Version}",
+        f"Flags: {hex(sym_from_data.Flags)}",
+        f"Flags2: {hex(sym_from_data.Flags2)}",
+        f"RotA: {sym_from_data.RotA}",
+        f"RotB: {sym_from_data.RotB}",
+        f"TFlags: {hex(sym_from_data.TFlags)}",
+        f"ScaleAX: {sym_from_data.ScaleAX}",
+        f"ScaleBX: {sym_from_data.ScaleBX}",
+        f"ScaleAY: {sym_from_data.ScaleAY}",
+        f"ScaleBY: {sym_from_data.ScaleBY}",
+        f"ShearA: {sym_from_data.ShearA}",
+        f"ShearB: {sym_from_data.ShearB}",
+        f"OffsetHiX: {sym_from_data.OffsetHiX}",
+        f"OffsetHiY: {sym_from_data.OffsetHiY}",
+        f"OffsetLowX: {sym_from_data.OffsetLowX}",
+        f"OffsetLowY: {sym_from_data.OffsetLowY}",
+        f"GFlags: {hex(sym_from_data.GFlags)}",
+        f"Sheet: {cstr(sym_from_data.Sheet)}",
+        f"DrawToolName: {cstr(sym_from_data.DrawToolName)}",
+    ]) + "\n")
+    assert sym_from_data.CStuff.ERLen == SYMINFO.SIZE
+    assert erlen_matches(SYMINFO, data)
     #############################################################
     # Ensure a dummy file exists for testing
     if not os.path.exists("test_image.png"):
@@ -833,21 +1201,85 @@ if __name__ == "__main__":
         width, height = png_dimensions("test_image.png")
         if width is not None:
             print(f"The dimensions of test_image.png are: {width}x{height} pixels.")
+
+            # The bulk builder must produce exactly the same bytes as SimpleSymbol
+            names = ["Bulk Symbol 1", "Bulk Symbol 2"]
+            is_groups = [False, True]
+            bulk = build_simple_symbols_bulk(names, ["test_image.png"] * 2, is_groups)
+            expected = b"".join(bytes(SimpleSymbol(n, "test_image.png", g)) for n, g in zip(names, is_groups))
+            assert bulk == expected
+            print("Bulk SimpleSymbol build matches SimpleSymbol.")
+
+            # ...and read back as an array of symbols in one call
+            bulk_symbols = SimpleSymbol.view_array(bulk, len(names))
+            assert [symbol.symbol_definition.SName for symbol in bulk_symbols] == [n.encode('utf-8') for n in names]
+            assert [bool(symbol.symbol_info.Flags & SF_GROUPED) for symbol in bulk_symbols] == is_groups
+            validate_erlen(bulk_symbols)
+            assert erlen_matches(SimpleSymbol, bulk, SimpleSymbol.SIZE)
+
+            # The symbol extents' z and low corner are left at the zero-filled defaults
+            for symbol in (SimpleSymbol("Zero Check", "test_image.png", False),
+                           VaricolorSymbol("Zero Check", "test_image.png", "test_image.png", False)):
+                extents = symbol.symbol_definition
+                assert (extents.Low.x, extents.Low.y, extents.Low.z, extents.Hi.z) == (0.0, 0.0, 0.0, 0.0)
+                assert extents.Hi.x == ctypes.c_float(width / 40).value
+                assert extents.Hi.y == ctypes.c_float(height / 40).value
     ############################################################
     # Test SYMDEF layout
-    data = bytes([
-        0x58, 0x00, 0x00, 0x00, 0x1C, 0x00, 0x00, 0xE0, 0xE0, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 
-        0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0B, 0x2C, 0x00, 0x00, 0x81, 0xF3, 0x17, 0xB4, 
-        0x38, 0x33, 0x4F, 0xC0, 0x00, 0x00, 0x00, 0x00, 0x66, 0x66, 0xD9, 0x41, 0x33, 0x33, 0x4F, 0x40, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x57, 0x6F, 0x6F, 0x64, 0x70, 0x65, 0x63, 0x6B, 
-        0x65, 0x72, 0x20, 0x57, 0x68, 0x61, 0x6C, 0x65, 0x20, 0x76, 0x61, 0x72, 0x69, 0x00, 0x00, 0x00, 
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    ])
-    symdef_from_data = SYMDEF.from_buffer_copy(data)
+    data = bytearray.fromhex("""
+        58 00 00 00 1C 00 00 E0 E0 00 00 00 00 01 00 00
+        00 00 01 00 00 00 00 00 0B 2C 00 00 81 F3 17 B4
+        38 33 4F C0 00 00 00 00 66 66 D9 41 33 33 4F 40
+        00 00 00 00 00 00 00 00 57 6F 6F 64 70 65 63 6B
+        65 72 20 57 68 61 6C 65 20 76 61 72 69 00 00 00
+        00 00 00 00 00 00 00 00
+    """)
+    symdef_from_data = SYMDEF.view(data)
     print(f"\nSYMDEF created from byte array dump:")
     print(symdef_from_data)
-    print(f"\nTotal size of SYMDEF structure from data: {ctypes.sizeof(SYMDEF)} bytes")
-    assert symdef_from_data.CStuff.ERLen == ctypes.sizeof(SYMDEF)
+    print(f"\nTotal size of SYMDEF structure from data: {SYMDEF.SIZE} bytes")
+    assert symdef_from_data.CStuff.ERLen == SYMDEF.SIZE
+    assert erlen_matches(SYMDEF, data)
     #############################################################
 
-    
\ No newline at end of file
+    
+    # Round trip a small catalog file: write the header and symbols into an mmap of it
+    # with write_into, then read them back with read_array and through FSCReader
+    import tempfile
+
+    round_trip_names = ["Round Trip 1", "Round Trip 2"]
+    round_trip_symbols = bytearray(SimpleSymbol.SIZE * len(round_trip_names))
+    offset = 0
+    for name in round_trip_names:
+        offset = pack_simple_into(round_trip_symbols, offset, name, "round_trip.png", 80, 40, False)
+
+    header = FileID()
+    header_size = ctypes.sizeof(FileID)
+    fd, catalog_path = tempfile.mkstemp(suffix=".FSC")
+    try:
+        with os.fdopen(fd, "w+b") as f:
+            f.truncate(header_size + len(round_trip_symbols))
+            with mmap.mmap(f.fileno(), 0) as mm:
+                offset = header.write_into(mm, 0)
+                for symbol in SimpleSymbol.view_array(round_trip_symbols, len(round_trip_names)):
+                    offset = symbol.write_into(mm, offset)
+                assert offset == len(mm)
+
+        with open(catalog_path, "rb") as f:
+            f.seek(header_size)
+            read_back = SimpleSymbol.read_array(f, len(round_trip_names))
+        assert bytes(read_back) == round_trip_symbols
+        validate_erlen(read_back)
+
+        with FSCReader(catalog_path) as reader:
+            assert len(reader) == header_size + len(round_trip_symbols)
+            file_id = reader.struct_at(FileID, 0)
+            second = reader.struct_at(SimpleSymbol, header_size + SimpleSymbol.SIZE)
+        # The views are still usable after the reader is closed
+        assert bytes(file_id) == bytes(header)
+        assert second.symbol_definition.SName == b"Round Trip 2"
+        assert second.picture_info.RWid == 2.0
+        print("\nCatalog round trip through write_into, read_array and FSCReader passed.")
+        del file_id, second
+    finally:
+        os.remove(catalog_path)